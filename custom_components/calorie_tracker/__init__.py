@@ -52,8 +52,12 @@ from .linked_components import (
     discover_unlinked_peloton_profiles,
     setup_linked_component_listeners,
 )
-from .services import async_setup_services, async_unload_services
-from .storage import STORAGE_KEY, CalorieStorageManager, get_user_profile_map
+from .services import (
+    async_setup_services,
+    async_track_spoken_name,
+    async_unload_services,
+)
+from .storage import STORAGE_KEY, get_storage_manager, get_user_profile_map
 from .websockets import register_websockets
 
 _PLATFORMS: list[Platform] = [Platform.SENSOR]
@@ -231,7 +235,7 @@ async def async_setup_entry(
     height_unit = entry.data.get(HEIGHT_UNIT, "cm")
     neat = entry.data.get(NEAT, 1.2)
 
-    storage = CalorieStorageManager(hass, entry.entry_id)
+    storage = get_storage_manager(hass, entry.entry_id)
 
     user = CalorieTrackerUser(
         spoken_name=spoken_name,
@@ -271,10 +275,7 @@ async def async_setup_entry(
     entry.runtime_data = {
         "user": user,
     }
-
-    if STORAGE_KEY not in hass.data:
-        hass.data[STORAGE_KEY] = {}
-    hass.data[STORAGE_KEY][entry.entry_id] = storage
+    async_track_spoken_name(hass, entry)
 
     # Register the device for this config entry
     device_registry = dr.async_get(hass)
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import logging
+import time
 from typing import Any, Protocol
 
 import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
+# (valid until timestamp, time zone, local date, ISO string) for "today"
+_TODAY_CACHE: tuple[float, Any, date, str] | None = None
+
+
+def local_today() -> tuple[date, str]:
+    """Return today's local date and its ISO string, recomputed after midnight."""
+    global _TODAY_CACHE
+    if (
+        _TODAY_CACHE is None
+        or time.time() >= _TODAY_CACHE[0]
+        or _TODAY_CACHE[1] is not dt_util.DEFAULT_TIME_ZONE
+    ):
+        today = dt_util.now().date()
+        next_midnight = dt_util.start_of_local_day(today + timedelta(days=1))
+        _TODAY_CACHE = (
+            next_midnight.timestamp(),
+            dt_util.DEFAULT_TIME_ZONE,
+            today,
+            today.isoformat(),
+        )
+    return _TODAY_CACHE[2], _TODAY_CACHE[3]
+
 
 def _normalize_local_timestamp(ts: datetime | str | None = None) -> str:
     """Return a local timestamp string (YYYY-MM-DDTHH:MM)."""
@@ -27,6 +51,14 @@ def _normalize_local_timestamp(ts: datetime | str | None = None) -> str:
     return dt.isoformat(timespec="minutes")
 
 
+@lru_cache(maxsize=8)
+def iso_date_range(start_date: str, end_date: str) -> tuple[str, ...]:
+    """Return the YYYY-MM-DD strings from start_date to end_date inclusive."""
+    start = date.fromisoformat(start_date).toordinal()
+    end = date.fromisoformat(end_date).toordinal()
+    return tuple(date.fromordinal(day).isoformat() for day in range(start, end + 1))
+
+
 class StorageProtocol(Protocol):
     """Protocol defining the storage interface for calorie, exercise, and weight entries."""
 
@@ -34,6 +66,11 @@ class StorageProtocol(Protocol):
         """Asynchronously load stored data from persistent storage."""
         raise NotImplementedError
 
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the stored data changes."""
+        raise NotImplementedError
+
     async def async_save(self) -> None:
         """Asynchronously persist the current data to persistent storage."""
         raise NotImplementedError
@@ -63,6 +100,14 @@ class StorageProtocol(Protocol):
         """Return the list of stored exercise entries."""
         raise NotImplementedError
 
+    def get_food_entries_for_date(self, date_str: str) -> list[dict[str, Any]]:
+        """Return the food entries logged on a date (YYYY-MM-DD)."""
+        raise NotImplementedError
+
+    def get_exercise_entries_for_date(self, date_str: str) -> list[dict[str, Any]]:
+        """Return the exercise entries logged on a date (YYYY-MM-DD)."""
+        raise NotImplementedError
+
     def get_weight(self, date_str: str) -> float | None:
         """Get the weight for a specific date (YYYY-MM-DD)."""
         raise NotImplementedError
@@ -131,6 +176,9 @@ class CalorieTrackerUser:
         # when queried with historical data present in storage.
         self._body_fat_pct = 0.0
         self._neat = neat
+        # (date, revision and profile key, BMR * NEAT) from the last
+        # get_bmr_and_neat call
+        self._bmr_and_neat_cache: tuple[tuple[Any, ...], float | None] | None = None
 
     def get_goal(self, date_str: str | None = None) -> dict[str, Any] | None:
         """Get the goal for a given date (or today if not specified).
@@ -140,7 +188,7 @@ class CalorieTrackerUser:
             Returns None if no goal is set.
         """
         if date_str is None:
-            date_str = dt_util.now().date().isoformat()
+            date_str = local_today()[1]
         return self._storage.get_goal(date_str)
 
     async def add_goal(
@@ -154,7 +202,7 @@ class CalorieTrackerUser:
         percentage changes (e.g. 0.75%).
         """
         if date_str is None:
-            date_str = dt_util.now().date().isoformat()
+            date_str = local_today()[1]
 
         if goal_type in ("variable_cut", "variable_bulk"):
             # Preserve two decimals of precision
@@ -193,24 +241,16 @@ class CalorieTrackerUser:
     def get_log(self, date_str: str | None = None) -> dict[str, Any]:
         """Return the food, exercise, and weight log for the specified date, or today if not specified."""
         if date_str is None:
-            target_date_str = dt_util.now().date().isoformat()
+            target_date_str = local_today()[1]
         elif "T" in date_str:
             # Extract date part from full timestamp
             target_date_str = date_str.split("T")[0]
         else:
             target_date_str = date_str
 
-        # Use fast string prefix matching instead of parsing every timestamp
-        food_entries = [
-            entry
-            for entry in self._storage.get_food_entries()
-            if entry["timestamp"].startswith(target_date_str)
-        ]
-        exercise_entries = [
-            entry
-            for entry in self._storage.get_exercise_entries()
-            if entry["timestamp"].startswith(target_date_str)
-        ]
+        # Storage keeps entries bucketed by day, so only this day's are touched
+        food_entries = self._storage.get_food_entries_for_date(target_date_str)
+        exercise_entries = self._storage.get_exercise_entries_for_date(target_date_str)
 
         weight = self.get_weight(date_str)
         body_fat_pct = self.get_body_fat_pct(date_str)
@@ -225,6 +265,29 @@ class CalorieTrackerUser:
             "calories": (food, exercise),
         }
 
+    def get_calorie_totals_range(
+        self, start_date: str, end_date: str
+    ) -> dict[str, tuple[int, int]]:
+        """Return (food, exercise) calorie totals for each day in an inclusive range.
+
+        Dates are YYYY-MM-DD strings. Days without entries map to (0, 0). Only the
+        entries logged on days in the range are read from storage.
+        """
+        storage = self._storage
+        return {
+            day: (
+                sum(
+                    e.get("calories", 0) or 0
+                    for e in storage.get_food_entries_for_date(day)
+                ),
+                sum(
+                    e.get("calories_burned", 0) or 0
+                    for e in storage.get_exercise_entries_for_date(day)
+                ),
+            )
+            for day in iso_date_range(start_date, end_date)
+        }
+
     def get_weekly_summary(
         self, date_str: str | None = None, include_macros: bool = True, week_start_day: str = "sunday"
     ) -> dict[
@@ -246,7 +309,7 @@ class CalorieTrackerUser:
         target_date = (
             dt_util.parse_datetime(date_str).date()
             if date_str
-            else dt_util.now().date()
+            else local_today()[0]
         )
         
         # Calculate week start based on preference
@@ -263,27 +326,13 @@ class CalorieTrackerUser:
         summary: dict[
             str, tuple[int, int, int, int, str, float, int | float, dict[str, int], int]
         ] = {}
-        food_by_day: dict[str, int] = {d.isoformat(): 0 for d in week_dates}
-        exercise_by_day: dict[str, int] = {d.isoformat(): 0 for d in week_dates}
-
-        for entry in self._storage.get_food_entries():
-            # Use fast string prefix matching - timestamps are formatted as "YYYY-MM-DD..."
-            entry_date_prefix = entry["timestamp"][:10]  # Extract YYYY-MM-DD part
-            if entry_date_prefix in food_by_day:
-                food_by_day[entry_date_prefix] += entry.get("calories", 0) or 0
-
-        for entry in self._storage.get_exercise_entries():
-            # Use fast string prefix matching - timestamps are formatted as "YYYY-MM-DD..."
-            entry_date_prefix = entry["timestamp"][:10]  # Extract YYYY-MM-DD part
-            if entry_date_prefix in exercise_by_day:
-                exercise_by_day[entry_date_prefix] += (
-                    entry.get("calories_burned", 0) or 0
-                )
+        totals_by_day = self.get_calorie_totals_range(
+            week_dates[0].isoformat(), week_dates[-1].isoformat()
+        )
 
         for d in week_dates:
             date_iso = d.isoformat()
-            food = food_by_day[date_iso]
-            exercise = exercise_by_day[date_iso]
+            food, exercise = totals_by_day[date_iso]
             bmr = self.calculate_bmr(date_iso) or 0.0
             bmr_and_neat = int(round((bmr * self._neat) if bmr else 0.0))
             goal = self.get_goal(date_iso) or {}
@@ -363,7 +412,7 @@ class CalorieTrackerUser:
         target_date = (
             dt_util.parse_datetime(date_str).date()
             if date_str
-            else dt_util.now().date()
+            else local_today()[0]
         )
         return self._storage.get_daily_macros(target_date.isoformat())
 
@@ -372,7 +421,7 @@ class CalorieTrackerUser:
     ) -> None:
         """Asynchronously log a weight entry for a specific date (defaults to today)."""
         if date_str is None:
-            date_str = dt_util.now().date().isoformat()
+            date_str = local_today()[1]
         elif "T" in date_str:
             date_str = date_str.split("T")[0]
         await self._storage.async_log_weight(date_str, weight)
@@ -382,7 +431,7 @@ class CalorieTrackerUser:
     ) -> None:
         """Asynchronously log a body fat percentage entry for a specific date (defaults to today)."""
         if date_str is None:
-            date_str = dt_util.now().date().isoformat()
+            date_str = local_today()[1]
         elif "T" in date_str:
             date_str = date_str.split("T")[0]
         await self._storage.async_log_body_fat_pct(date_str, body_fat_pct)
@@ -423,7 +472,7 @@ class CalorieTrackerUser:
         target_date = (
             dt_util.parse_datetime(date_str).date()
             if date_str
-            else dt_util.now().date()
+            else local_today()[0]
         )
         target_iso = target_date.isoformat()
 
@@ -607,7 +656,7 @@ class CalorieTrackerUser:
         target_date = (
             dt_util.parse_datetime(date_str).date()
             if date_str
-            else dt_util.now().date()
+            else local_today()[0]
         )
         age = target_date.year - birth_year
 
@@ -625,6 +674,35 @@ class CalorieTrackerUser:
 
         return round(bmr, 1)
 
+    def get_bmr_and_neat(self, date_str: str | None = None) -> float | None:
+        """Return BMR * NEAT multiplier for a date, or None if BMR is unavailable.
+
+        The result is reused until the date, the stored data or a profile
+        field that feeds the BMR changes, so repeat calls skip the weight and
+        body fat lookups.
+        """
+        key = (
+            date_str[:10] if date_str else local_today()[1],
+            self._storage.revision,
+            self._neat,
+            self._weight_unit,
+            self._sex,
+            self._birth_year,
+            self._height,
+            self._height_unit,
+            # Fallbacks when no weight or body fat has been logged
+            self._starting_weight,
+            self._body_fat_pct,
+        )
+        cached = self._bmr_and_neat_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        bmr = self.calculate_bmr(date_str)
+        result = None if bmr is None else bmr * self._neat
+        self._bmr_and_neat_cache = (key, result)
+        return result
+
     def get_body_fat_pct(self, date_str: str | None = None) -> float | None:
         """Return the body fat percentage for the specified date, with fallback logic.
 
@@ -636,7 +714,7 @@ class CalorieTrackerUser:
         target_date = (
             dt_util.parse_datetime(date_str).date()
             if date_str
-            else dt_util.now().date()
+            else local_today()[0]
         )
         target_iso = target_date.isoformat()
 
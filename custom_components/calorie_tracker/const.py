@@ -26,6 +26,7 @@ DURATION = "duration"
 CALORIES_BURNED = "calories_burned"
 WEIGHT = "weight"
 TIMESTAMP = "timestamp"
+FIELDS = "fields"  # fetch_data: which parts of the day to return
 NEAT = "neat"
 BIRTH_YEAR = "birth_year"
 SEX = "sex"  # 'male' | 'female'
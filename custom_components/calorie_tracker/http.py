@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import UTC, datetime
 from io import BytesIO
 import json
@@ -533,7 +534,9 @@ class CalorieTrackerFetchAnalyzersView(HomeAssistantView):
         hass: HomeAssistant = request.app["hass"]
 
         analyzers = await discover_image_analyzers(hass)
-        return web.json_response({"analyzers": analyzers})
+        return web.json_response(
+            {"analyzers": [asdict(analyzer) for analyzer in analyzers]}
+        )
 
 
 class CalorieTrackerSetPreferredAnalyzerView(HomeAssistantView):
@@ -376,6 +376,7 @@ class LogWeight(intent.IntentHandler):
                 timestamp_param = f"{date_str}T{time_part}"
 
         await sensor.user.async_log_weight(weight, date_str=timestamp_param)
+        await sensor.async_update_calories()
 
         response.async_set_speech(
             {
@@ -433,6 +434,7 @@ class LogBodyFat(intent.IntentHandler):
 
         # Log body fat percentage
         await sensor.user.async_log_body_fat_pct(body_fat_pct, date_str=date_str)
+        await sensor.async_update_calories()
 
         response.async_set_speech(
             {
@@ -505,6 +507,7 @@ class LogExercise(intent.IntentHandler):
             calories_burned=calories_burned,
             timestamp=timestamp_param,
         )
+        await sensor.async_update_calories()
 
         response.async_set_speech(f"Logged '{exercise_type}'" + f" for {spoken_name}")
         return response
@@ -1,7 +1,14 @@
 """Linked component listeners for Calorie Tracker."""
 
+from __future__ import annotations
+
+import asyncio
+import dataclasses
 import datetime
+import functools
 import logging
+import threading
+from typing import TYPE_CHECKING, Any
 
 try:
     from homeassistant.components.ai_task.const import (
@@ -12,9 +19,10 @@ except ImportError:
     AI_TASK_DATA_COMPONENT = None
     AITaskEntityFeature = None
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
 import homeassistant.util.dt as dt_util
 
 from .calorie_tracker_user import CalorieTrackerUser
@@ -26,6 +34,9 @@ from .const import (
     DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -35,55 +46,94 @@ _AI_TASK_ANALYZERS = {
         "setup_url": "https://www.home-assistant.io/integrations/openai_conversation/",
         "default_model": DEFAULT_OPENAI_MODEL,
         "model_key": "chat_model",
+        "model_prefix": None,
     },
     "google_generative_ai_conversation": {
         "name": "Google Gemini",
         "setup_url": "https://www.home-assistant.io/integrations/google_generative_ai_conversation/",
         "default_model": DEFAULT_GEMINI_MODEL,
         "model_key": "chat_model",
+        "model_prefix": "models/",
     },
     "azure_ai_tasks": {
         "name": "Azure AI Task",
         "setup_url": "https://github.com/loryanstrant/HA-Azure-AI-tasks",
         "default_model": DEFAULT_AZURE_MODEL,
         "model_key": "chat_model",
+        "model_prefix": None,
     },
     "ollama": {
         "name": "Ollama",
         "setup_url": "https://www.home-assistant.io/integrations/ollama/",
         "default_model": None,
         "model_key": "model",
+        "model_prefix": None,
     },
     "anthropic": {
         "name": "Anthropic Claude",
         "setup_url": "https://www.home-assistant.io/integrations/anthropic/",
         "default_model": DEFAULT_ANTHROPIC_MODEL,
         "model_key": "chat_model",
+        "model_prefix": None,
     },
     "open_router": {
         "name": "OpenRouter",
         "setup_url": "https://www.home-assistant.io/integrations/open_router/",
         "default_model": None,
         "model_key": "chat_model",
+        "model_prefix": None,
     },
 }
 
 
+PELOTON_POLL_INTERVAL = datetime.timedelta(seconds=90)
+PELOTON_IDLE_POLL_INTERVAL = datetime.timedelta(minutes=15)
+PELOTON_IDLE_THRESHOLD = datetime.timedelta(hours=4)
+
+_PELOTON_DISCIPLINE_MAP = {
+    "cycling": "Cycling",
+    "running": "Running",
+    "walking": "Walking",
+    "strength": "Strength Training",
+    "yoga": "Yoga",
+    "meditation": "Meditation",
+    "stretching": "Stretching",
+    "cardio": "Cardio",
+    "bootcamp": "Bootcamp",
+    "caesar": "Rowing",
+}
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class AnalyzerInfo:
+    """An ai_task entity that can analyze food or body fat photos."""
+
+    domain: str
+    name: str
+    setup_url: str
+    config_entry: str
+    title: str
+    available: bool
+    model: str | None
+    ai_task_entity_id: str
+    subentry_id: str | None
+
+
 def _normalize_model(
-    domain: str, raw_model: str | None, default: str | None
+    raw_model: str | None, default: str | None, prefix: str | None
 ) -> str | None:
     """Normalize raw model names for display."""
 
     model_name = raw_model or default
-    if domain == "google_generative_ai_conversation" and isinstance(model_name, str):
-        return model_name.removeprefix("models/")
+    if prefix and isinstance(model_name, str):
+        return model_name.removeprefix(prefix)
     return model_name
 
 
-async def discover_image_analyzers(hass: HomeAssistant) -> list[dict]:
+async def discover_image_analyzers(hass: HomeAssistant) -> list[AnalyzerInfo]:
     """Discover available image analysis integrations backed by ai_task entities."""
 
-    available_analyzers: list[dict] = []
+    available_analyzers: list[AnalyzerInfo] = []
 
     entity_component = hass.data.get(AI_TASK_DATA_COMPONENT)
 
@@ -113,11 +163,10 @@ async def discover_image_analyzers(hass: HomeAssistant) -> list[dict]:
             continue
 
         domain = config_entry.domain
-        if domain not in _AI_TASK_ANALYZERS:
+        metadata = _AI_TASK_ANALYZERS.get(domain)
+        if metadata is None:
             continue
 
-        metadata = _AI_TASK_ANALYZERS[domain]
-
         platform = getattr(entity, "platform", None)
         if platform is None:
             continue
@@ -138,22 +187,24 @@ async def discover_image_analyzers(hass: HomeAssistant) -> list[dict]:
             else config_entry.title or config_entry.entry_id
         )
 
-        analyzer = {
-            "domain": domain,
-            "name": metadata["name"],
-            "setup_url": metadata["setup_url"],
-            "config_entry": config_entry.entry_id,
-            "title": analyzer_title,
-            "available": bool(entity.available),
-            "model": _normalize_model(domain, raw_model, metadata["default_model"]),
-            "ai_task_entity_id": entity.entity_id,
-            "subentry_id": getattr(subentry, "subentry_id", None),
-        }
+        analyzer = AnalyzerInfo(
+            domain=domain,
+            name=metadata["name"],
+            setup_url=metadata["setup_url"],
+            config_entry=config_entry.entry_id,
+            title=analyzer_title,
+            available=bool(entity.available),
+            model=_normalize_model(
+                raw_model, metadata["default_model"], metadata["model_prefix"]
+            ),
+            ai_task_entity_id=entity.entity_id,
+            subentry_id=getattr(subentry, "subentry_id", None),
+        )
         available_analyzers.append(analyzer)
         _LOGGER.debug(
             "Found ai_task analyzer: domain=%s title=%s entity=%s",  # short log
             domain,
-            analyzer["title"],
+            analyzer.title,
             entity.entity_id,
         )
 
@@ -170,16 +221,21 @@ async def setup_linked_component_listeners(
 ):
     """Set up all linked component listeners for this Calorie Tracker entry.
 
-    If startup is True, register listeners for homeassistant_started.
-    If startup is False, immediately set up listeners and return remove_callbacks.
+    If startup is True, set up listeners once Home Assistant has started (or right
+    away if it already has). If startup is False, immediately set up listeners and
+    return remove_callbacks.
     """
 
-    async def _setup_all_linked_listeners():
-        remove_callbacks = []
+    def _get_linked_profiles() -> dict:
         options = entry.options or {}
-        linked_profiles = options.get("linked_component_profiles") or options.get(
+        return options.get("linked_component_profiles") or options.get(
             "linked_exercise_profiles", {}
         )
+
+    async def _setup_all_linked_listeners():
+        remove_callbacks = []
+        linked_profiles = _get_linked_profiles()
+        setup_coros = []
         for domain, entry_ids in linked_profiles.items():
             if domain == "peloton":
                 for linked_entry_id in entry_ids:
@@ -187,46 +243,41 @@ async def setup_linked_component_listeners(
                         "Setting up peloton listener for linked_entry_id: %s",
                         linked_entry_id,
                     )
-                    remove_cb = await setup_peloton_listener(
-                        hass, linked_entry_id, user
+                    setup_coros.append(
+                        setup_peloton_listener(hass, linked_entry_id, user, entry)
                     )
-                    if remove_cb:
-                        remove_callbacks.append(remove_cb)
+        # Each setup fetches recent workouts over the network; run them concurrently
+        for remove_cb in await asyncio.gather(*setup_coros):
+            if remove_cb:
+                remove_callbacks.append(remove_cb)
         entry.runtime_data["remove_callbacks"] = remove_callbacks
         return remove_callbacks
 
-    async def _on_ha_started(event=None):
+    async def _on_ha_started(_hass: HomeAssistant) -> None:
         await _setup_all_linked_listeners()
 
     if startup:
-        hass.bus.async_listen_once("homeassistant_started", _on_ha_started)
+        # Nothing to listen for until a component is linked
+        if not _get_linked_profiles():
+            return None
+        async_at_started(hass, _on_ha_started)
         return None
 
     # Remove old callbacks if they exist
-    old_callbacks = entry.runtime_data.get("remove_callbacks", [])
-    for callback in old_callbacks:
-        if callable(callback):
-            callback()
+    old_callbacks = entry.runtime_data.get("remove_callbacks") or []
+    for remove_cb in old_callbacks:
+        if callable(remove_cb):
+            remove_cb()
     # Immediately set up listeners
     return await _setup_all_linked_listeners()
 
 
+@functools.lru_cache(maxsize=32)
 def _map_peloton_discipline_to_exercise_type(discipline: str) -> str:
     """Map Peloton fitness discipline to exercise type."""
-    discipline_mapping = {
-        "cycling": "Cycling",
-        "running": "Running",
-        "walking": "Walking",
-        "strength": "Strength Training",
-        "yoga": "Yoga",
-        "meditation": "Meditation",
-        "stretching": "Stretching",
-        "cardio": "Cardio",
-        "bootcamp": "Bootcamp",
-        "caesar": "Rowing",
-    }
-
-    return discipline_mapping.get(discipline.lower(), "Peloton Workout")
+    # Peloton reports disciplines in lowercase; only fold case when needed
+    key = discipline if discipline.islower() else discipline.lower()
+    return _PELOTON_DISCIPLINE_MAP.get(key, "Peloton Workout")
 
 
 def _extract_calories_from_workout(workout: dict) -> int | None:
@@ -259,8 +310,55 @@ def _calculate_workout_duration(workout: dict) -> int | None:
         return None
 
 
+def _async_register_peloton_poll(
+    hass: HomeAssistant,
+    linked_entry_id,
+    tracker_entry_id: str,
+    poll: Callable[[Any], Awaitable[None]],
+) -> Callable[[], None]:
+    """Add a Peloton poll to the shared interval timer and return its remover.
+
+    All linked Peloton accounts are polled from one 90 second timer; the timer is
+    created with the first poll and cancelled when the last one is removed.
+    Polls are keyed per tracker too, since several trackers can link one account.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    polls: dict[tuple[str, str], Callable[[Any], Awaitable[None]]] = (
+        domain_data.setdefault("peloton_polls", {})
+    )
+    poll_key = (linked_entry_id, tracker_entry_id)
+    polls[poll_key] = poll
+
+    async def _async_poll_all(now) -> None:
+        results = await asyncio.gather(
+            *(poll_fn(now) for poll_fn in list(polls.values())),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("Error polling Peloton workouts: %s", result)
+
+    @callback
+    def _poll_all_callback(now) -> None:
+        hass.async_create_task(_async_poll_all(now), eager_start=True)
+
+    if domain_data.get("peloton_poll_unsub") is None:
+        domain_data["peloton_poll_unsub"] = async_track_time_interval(
+            hass, _poll_all_callback, PELOTON_POLL_INTERVAL
+        )
+
+    @callback
+    def _remove_poll() -> None:
+        if polls.get(poll_key) is poll:
+            del polls[poll_key]
+        if not polls and (unsub := domain_data.pop("peloton_poll_unsub", None)):
+            unsub()
+
+    return _remove_poll
+
+
 async def setup_peloton_listener(
-    hass: HomeAssistant, linked_entry_id, user: CalorieTrackerUser
+    hass: HomeAssistant, linked_entry_id, user: CalorieTrackerUser, tracker_entry
 ):
     """Set up a polling-based listener for Peloton workout completion."""
 
@@ -269,17 +367,38 @@ async def setup_peloton_listener(
     except ImportError:
         _LOGGER.error("Pylotoncycle package not available")
         return None
+    try:
+        from pylotoncycle.exceptions import PylotonCycleError as PelotonError
+    except ImportError:
+        # Older pylotoncycle releases only define the login exception
+        from pylotoncycle.pylotoncycle import PelotonLoginException as PelotonError
+    from requests import RequestException
+
+    # Logged-in PylotonCycle session shared by every fetch of this listener.
+    # Fetches run in executor threads, so the lock serializes use of it.
+    conn = None
+    conn_lock = threading.Lock()
+
+    def _get_recent_workouts(n):
+        """Fetch recent workouts, logging in again only if the session fails."""
+        nonlocal conn
+        with conn_lock:
+            if conn is not None:
+                try:
+                    return conn.GetRecentWorkouts(n)
+                except (RequestException, PelotonError) as e:
+                    _LOGGER.debug("Peloton session failed, logging in again: %s", e)
+                    conn = None
+            conn = PylotonCycle(username, password)
+            return conn.GetRecentWorkouts(n)
 
     # Initialize with up to 2 most recent COMPLETE workout IDs
     async def _async_get_recent_complete_workout_ids():
-        username = peloton_entry.data.get("username") if peloton_entry else None
-        password = peloton_entry.data.get("password") if peloton_entry else None
         if not username or not password:
             return []
 
         def _get_recent():
-            conn = PylotonCycle(username, password)
-            workouts = conn.GetRecentWorkouts(3)
+            workouts = _get_recent_workouts(3)
             ids = [w.get("id") for w in workouts if w.get("status") == "COMPLETE"]
             ids = ids[:2]
             ids.reverse()
@@ -287,23 +406,21 @@ async def setup_peloton_listener(
 
         return await hass.async_add_executor_job(_get_recent)
 
-    async def _async_get_recent_peloton_workouts(peloton_entry, n=2):
-        """Fetch the n most recent Peloton workouts for the given credentials."""
-        username = peloton_entry.data.get("username")
-        password = peloton_entry.data.get("password")
+    async def _async_get_recent_peloton_workouts(n=2):
+        """Fetch the n most recent Peloton workouts for the linked credentials."""
         if not username or not password:
             _LOGGER.warning("Peloton credentials not available")
             return []
 
         def _get_recent():
-            _LOGGER.debug(
-                "Peloton credentials - username: %s, password length: %s",
-                username,
-                len(password) if password else "None",
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Peloton credentials - username: %s, password length: %s",
+                    username,
+                    len(password) if password else "None",
+                )
             try:
-                conn = PylotonCycle(username, password)
-                return conn.GetRecentWorkouts(n)
+                return _get_recent_workouts(n)
             except Exception as e:
                 _LOGGER.error("Failed to create Peloton connection: %s", e)
                 _LOGGER.error(
@@ -342,6 +459,10 @@ async def setup_peloton_listener(
             peloton_entry = entry
             break
 
+    # Read credentials once; they are reused by every poll of this listener
+    username = peloton_entry.data.get("username") if peloton_entry else None
+    password = peloton_entry.data.get("password") if peloton_entry else None
+
     # Only initialize last_logged_ids if not already present (first setup only)
     if peloton_entry:
         if last_logged_key not in hass.data[DOMAIN]:
@@ -350,14 +471,32 @@ async def setup_peloton_listener(
     elif last_logged_key not in hass.data[DOMAIN]:
         hass.data[DOMAIN][last_logged_key] = []
 
+    # While the account is idle, only fetch once per idle interval
+    next_idle_poll = None
+
     async def poll_latest_workout(now, peloton_entry=peloton_entry):
+        nonlocal next_idle_poll
         if not peloton_entry:
             _LOGGER.warning("Peloton config entry %s not found", linked_entry_id)
             return
 
+        if next_idle_poll is not None and now < next_idle_poll:
+            return
+
         last_logged_ids = hass.data[DOMAIN].get(last_logged_key, [])
-        workouts = await _async_get_recent_peloton_workouts(peloton_entry, n=2)
+        workouts = await _async_get_recent_peloton_workouts(n=2)
+
+        # Back off when the most recent workout finished a long time ago
+        latest_end = workouts[0].get("end_time") if workouts else None
+        if (
+            isinstance(latest_end, (int, float))
+            and now.timestamp() - latest_end > PELOTON_IDLE_THRESHOLD.total_seconds()
+        ):
+            next_idle_poll = now + PELOTON_IDLE_POLL_INTERVAL
+        else:
+            next_idle_poll = None
 
+        logged = False
         for workout in reversed(workouts):
             workout_id = workout.get("id")
             status = workout.get("status")
@@ -390,6 +529,7 @@ async def setup_peloton_listener(
                 calories_burned=calories_burned,
                 timestamp=timestamp_str,
             )
+            logged = True
             # FIFO: keep only last 2 logged workout IDs
             last_logged_ids.append(workout_id)
             if len(last_logged_ids) > 2:
@@ -401,16 +541,14 @@ async def setup_peloton_listener(
                 workout_id,
             )
 
-    # Register polling every 90 seconds
+        # Push the new exercise calories to the sensor right away
+        sensor = tracker_entry.runtime_data.get("sensor") if logged else None
+        if sensor:
+            sensor.async_schedule_update_calories()
 
-    # Use a sync callback to schedule the async poll_latest_workout safely from any thread
-    def _poll_latest_workout_callback(now):
-        hass.add_job(poll_latest_workout(now, peloton_entry))
-
-    remove_cb = async_track_time_interval(
-        hass,
-        _poll_latest_workout_callback,
-        datetime.timedelta(seconds=90),
+    # Poll every 90 seconds (less often while idle, see above) on the shared timer
+    remove_cb = _async_register_peloton_poll(
+        hass, linked_entry_id, tracker_entry.entry_id, poll_latest_workout
     )
     _LOGGER.info("Peloton polling listener set up for entry: %s", linked_entry_id)
     return remove_cb
@@ -442,11 +580,12 @@ async def discover_unlinked_peloton_profiles(hass: HomeAssistant):
         if entry.entry_id not in linked_peloton_entry_ids
     ]
 
-    _LOGGER.debug(
-        "Found %d unlinked Peloton profiles: %s",
-        len(unlinked),
-        [u["entry_id"] for u in unlinked],
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Found %d unlinked Peloton profiles: %s",
+            len(unlinked),
+            [u["entry_id"] for u in unlinked],
+        )
 
     # Save or expose this list for the UI
     hass.data.setdefault("calorie_tracker", {})["unlinked_peloton_profiles"] = unlinked
@@ -504,18 +643,25 @@ async def remove_linked_component_profile(
     linked_component_entry_id: str,
 ) -> bool:
     """Remove a linked component profile from config entry options and reset listeners."""
-    options = dict(entry.options or {})
-    linked_profiles = dict(options.get("linked_component_profiles", {}))
-    entry_ids = list(linked_profiles.get(linked_domain, []))
+    options = entry.options or {}
+    linked_profiles = options.get("linked_component_profiles") or {}
+    entry_ids = linked_profiles.get(linked_domain) or []
     if linked_component_entry_id not in entry_ids:
         return False  # Not linked
-    entry_ids.remove(linked_component_entry_id)
-    if entry_ids:
-        linked_profiles[linked_domain] = entry_ids
+    # Only the touched domain list is rebuilt; other branches are shared as-is
+    remaining_ids = [eid for eid in entry_ids if eid != linked_component_entry_id]
+    if remaining_ids:
+        new_linked_profiles = {**linked_profiles, linked_domain: remaining_ids}
     else:
-        linked_profiles.pop(linked_domain, None)
-    options["linked_component_profiles"] = linked_profiles
-    hass.config_entries.async_update_entry(entry, options=options)
+        new_linked_profiles = {
+            domain: ids
+            for domain, ids in linked_profiles.items()
+            if domain != linked_domain
+        }
+    hass.config_entries.async_update_entry(
+        entry,
+        options={**options, "linked_component_profiles": new_linked_profiles},
+    )
     # Reset listeners
     await setup_linked_component_listeners(hass, entry, user, startup=False)
     return True
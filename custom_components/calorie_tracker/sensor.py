@@ -4,37 +4,39 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import RestoreSensor
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_change
-
-# Compatibility for Home Assistant versions
-try:
-    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-except ImportError:
-    # For older HA versions, fallback type annotation
-    AddConfigEntryEntitiesCallback = None
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
 import homeassistant.util.dt as dt_util
 
 from . import CALORIE_TRACKER_DEVICE_INFO, CalorieTrackerConfigEntry
-from .calorie_tracker_user import CalorieTrackerUser
+from .calorie_tracker_user import CalorieTrackerUser, iso_date_range, local_today
 from .const import DEFAULT_WEEK_START_DAY, WEEK_START_DAY
 
+if TYPE_CHECKING:
+    # Only needed for the annotation; not present on older HA versions
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+
 _LOGGER = logging.getLogger(__name__)
 
+_NAME_PREFIX = "Calorie Tracker "
+
+# Window in which back-to-back background logs are folded into one state write
+_UPDATE_COALESCE_DELAY = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: CalorieTrackerConfigEntry,
-    async_add_entities,
+    async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Calorie Tracker sensors from a config entry."""
     user: CalorieTrackerUser = entry.runtime_data["user"]
     sensor = CalorieTrackerSensor(user, entry.entry_id)
     # Initialize track_macros flag from config entry options (default False)
-    sensor.track_macros = entry.options.get("track_macros", False)
+    sensor.track_macros = bool(entry.options.get("track_macros", False))
     entry.runtime_data["sensor"] = sensor
     async_add_entities([sensor])
     await sensor.async_update_calories()
@@ -53,78 +55,111 @@ class CalorieTrackerSensor(RestoreSensor):
         self._entry_id = entry_id
         self._attr_unique_id = entry_id
         self._attr_device_info = CALORIE_TRACKER_DEVICE_INFO
-        self._attr_name = f"Calorie Tracker {self.user.get_spoken_name()}"
+        self._attr_name = _NAME_PREFIX + self.user.get_spoken_name()
         self._midnight_unsub = None
+        self._update_unsub = None
         self.track_macros: bool = False
+        # (storage revision, attributes) from the last attribute build
+        self._attrs_cache: tuple[int, dict[str, Any]] | None = None
+        # Profile attributes that only change through the profile setters
+        self._profile_attrs: dict[str, Any] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Set up midnight update when sensor is added to Home Assistant."""
         await super().async_added_to_hass()
 
         # Schedule updates at midnight to refresh "today" data
-        self._midnight_unsub = async_track_time_change(
-            self.hass, self._handle_midnight_update, hour=0, minute=0, second=0
-        )
+        self._schedule_midnight_update()
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when sensor is removed."""
         if self._midnight_unsub:
             self._midnight_unsub()
             self._midnight_unsub = None
+        if self._update_unsub:
+            self._update_unsub()
+            self._update_unsub = None
         await super().async_will_remove_from_hass()
 
+    @callback
+    def _schedule_midnight_update(self) -> None:
+        """Schedule a one-shot refresh for the next local midnight."""
+        next_midnight = dt_util.start_of_local_day(local_today()[0] + timedelta(days=1))
+        self._midnight_unsub = async_track_point_in_time(
+            self.hass, self._handle_midnight_update, next_midnight
+        )
+
     @callback
     def _handle_midnight_update(self, now: Any) -> None:
         """Handle midnight update to refresh today's data."""
         _LOGGER.debug("Midnight update triggered, refreshing sensor state")
+        self._invalidate_attributes()
         self.async_write_ha_state()
+        self._schedule_midnight_update()
 
     @property
     def native_value(self) -> int:
         """Return the remaining calories for today (non-negative)."""
-        return max(0, self.user.calculate_remaining_calories())
+        return max(0, self.user.calculate_remaining_calories(local_today()[1]))
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return the state attributes."""
-        # Get today's data
-        today_log = self.user.get_log()
+        """Return the state attributes.
 
-        # Get yesterday's data
-        yesterday_date = (dt_util.now().date() - timedelta(days=1)).isoformat()
-        yesterday_log = self.user.get_log(yesterday_date)
+        Reused until the user's stored data changes or _invalidate_attributes()
+        is called, so polled state writes don't rebuild them each time.
+        """
+        revision = self.user.storage().revision
+        if self._attrs_cache is None or self._attrs_cache[0] != revision:
+            self._attrs_cache = (revision, self._build_extra_state_attributes())
+        return self._attrs_cache[1]
+
+    def _invalidate_attributes(self) -> None:
+        """Drop the cached state attributes so the next read rebuilds them."""
+        self._attrs_cache = None
+
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build the state attributes from the user's current data."""
+        # Resolve "today" once and pass it down so user lookups don't re-read the clock
+        today, today_iso = local_today()
+        user = self.user
 
-        # Calculate previous 7-day stats
-        prev_7days_food = 0
-        prev_7days_exercise = 0
+        # Get today's data
+        today_log = user.get_log(today_iso)
 
-        # Optimize: calculate date once outside loop
-        today = dt_util.now().date()
-        for i in range(1, 8):  # Days -1 to -7 (yesterday through 7 days ago)
-            date = (today - timedelta(days=i)).isoformat()
-            day_log = self.user.get_log(date)
-            day_food, day_exercise = day_log.get("calories", (0, 0))
-            prev_7days_food += day_food
-            prev_7days_exercise += day_exercise
+        # Previous 7 days (yesterday through 7 days ago) in a single storage pass
+        prev_7days_iso = iso_date_range(
+            (today - timedelta(days=7)).isoformat(),
+            (today - timedelta(days=1)).isoformat(),
+        )
+        yesterday_date = prev_7days_iso[-1]
+        prev_7days = user.get_calorie_totals_range(prev_7days_iso[0], yesterday_date)
+        prev_7days_food = sum(food for food, _ in prev_7days.values())
+        prev_7days_exercise = sum(exercise for _, exercise in prev_7days.values())
 
         # Today's and yesterday's detailed breakdown
         today_food, today_exercise = today_log.get("calories", (0, 0))
-        yesterday_food, yesterday_exercise = yesterday_log.get("calories", (0, 0))
+        yesterday_food, yesterday_exercise = prev_7days[yesterday_date]
 
-        goal = self.user.get_goal()
+        goal = user.get_goal(today_iso)
         # Safely extract goal fields when a goal does not yet exist
-        goal_type = goal.get("goal_type") if goal else self.user.get_goal_type()
+        goal_type = goal.get("goal_type") if goal else user.get_goal_type(today_iso)
         goal_start_date = goal.get("start_date") if goal else None
         goal_value = (
-            goal.get("goal_value", 0) if goal else getattr(self.user, "_goal_value", 0)
+            goal.get("goal_value", 0) if goal else getattr(user, "_goal_value", 0)
         )
 
+        current_weight = user.get_weight(today_iso)
+        body_fat_pct = user.get_body_fat_pct(today_iso)
+        # BMR and NEAT combined: calories burned before any logged exercise
+        bmr_and_neat = user.get_bmr_and_neat(today_iso)
+
         # Calculate net calories today and remaining calories
         net_calories_today = today_food - today_exercise
 
         # Calculate daily calorie goal and remaining calories using backend methods
-        daily_goal = self.user.calculate_daily_goal_calories()
-        calories_remaining_raw = self.user.calculate_remaining_calories()
+        daily_goal = user.calculate_daily_goal_calories(today_iso)
+        calories_remaining_raw = user.calculate_remaining_calories(today_iso)
         calories_remaining_today = max(0, calories_remaining_raw)
 
         # Get week_start_day from config entry
@@ -135,22 +170,19 @@ class CalorieTrackerSensor(RestoreSensor):
 
         return {
             # User profile data
-            "spoken_name": self.user.get_spoken_name(),
+            **self._get_profile_attributes(),
             "goal_type": goal_type,
             "goal_start_date": goal_start_date,
             "goal_value": goal_value,
             "daily_goal_calories": daily_goal,
-            "starting_weight": self.user.get_starting_weight() or None,
-            "goal_weight": self.user.get_goal_weight() or None,
-            "current_weight": self.user.get_weight(),
-            "weight_unit": self.user.get_weight_unit(),
-            "birth_year": self.user.get_birth_year(),
-            "sex": self.user.get_sex(),
-            "height": self.user.get_height(),
-            "height_unit": self.user.get_height_unit(),
-            "body_fat_pct": self.user.get_body_fat_pct(),
-            "activity_multiplier": self.user.get_neat(),
-            "calorie_burn_baseline": self._calculate_bmr_and_neat(),
+            "starting_weight": user.get_starting_weight() or None,
+            "goal_weight": user.get_goal_weight() or None,
+            "current_weight": current_weight,
+            "body_fat_pct": body_fat_pct,
+            "activity_multiplier": user.get_neat(),
+            "calorie_burn_baseline": None
+            if bmr_and_neat is None
+            else round(bmr_and_neat, 1),
             "week_start_day": week_start_day,
             # Today's detailed breakdown
             "food_calories_today": today_food,
@@ -161,55 +193,104 @@ class CalorieTrackerSensor(RestoreSensor):
             "food_calories_yesterday": yesterday_food,
             "exercise_calories_yesterday": yesterday_exercise,
             # Previous 7 days averages (excluding today)
-            "food_calories_7day_average": round(prev_7days_food / 7)
-            if prev_7days_food
-            else 0,
-            "exercise_calories_7day_average": round(prev_7days_exercise / 7)
-            if prev_7days_exercise
-            else 0,
-            "track_macros": bool(getattr(self, "track_macros", False)),
+            "food_calories_7day_average": round(prev_7days_food / 7),
+            "exercise_calories_7day_average": round(prev_7days_exercise / 7),
+            "track_macros": self.track_macros,
         }
 
+    def _get_profile_attributes(self) -> dict[str, Any]:
+        """Return the rarely-changing profile attributes, built on first use."""
+        if self._profile_attrs is None:
+            user = self.user
+            self._profile_attrs = {
+                "spoken_name": user.get_spoken_name(),
+                "weight_unit": user.get_weight_unit(),
+                "birth_year": user.get_birth_year(),
+                "sex": user.get_sex(),
+                "height": user.get_height(),
+                "height_unit": user.get_height_unit(),
+            }
+        return self._profile_attrs
+
+    async def async_update_profile(self) -> None:
+        """Refresh state after profile fields were changed on the user."""
+        self._profile_attrs = None
+        await self.async_update_calories()
+
     async def async_update_calories(self) -> None:
         """Force HA to update this entity's state from runtime_data."""
+        # This write covers any coalesced update still waiting to run
+        if self._update_unsub:
+            self._update_unsub()
+            self._update_unsub = None
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
-    def _calculate_bmr_and_neat(self) -> float | None:
-        """Calculate BMR and NEAT combined (BMR * NEAT multiplier).
+    @callback
+    def async_schedule_update_calories(self) -> None:
+        """Schedule an async_update_calories, folding bursts into one write."""
+        if self._update_unsub is None:
+            self._update_unsub = async_call_later(
+                self.hass, _UPDATE_COALESCE_DELAY, self._handle_scheduled_update
+            )
 
-        This represents the calories burned from basal metabolic rate plus
-        non-exercise activity thermogenesis (daily activities excluding exercise).
-        """
-        bmr = self.user.calculate_bmr()
-        if bmr is None:
-            return None
-        neat_multiplier = self.user.get_neat()
-        return round(bmr * neat_multiplier, 1)
+    async def _handle_scheduled_update(self, now: Any) -> None:
+        """Run the coalesced update."""
+        self._update_unsub = None
+        await self.async_update_calories()
+
+    def _set_display_name(self, spoken_name: str) -> bool:
+        """Set the entity name for a spoken name and return whether it changed."""
+        name = _NAME_PREFIX + spoken_name
+        if name == self._attr_name:
+            return False
+        self._attr_name = name
+        return True
 
     def update_spoken_name(self, spoken_name: str) -> None:
         """Update the spoken name and entity display name."""
         self.user.set_spoken_name(spoken_name)
-        self._attr_name = f"Calorie Tracker {self.user.get_spoken_name()}"
+        if not self._set_display_name(spoken_name):
+            return
+        self._profile_attrs = None
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
     def update_starting_weight(self, weight: float) -> None:
         """Update the starting weight."""
+        previous = self.user.get_starting_weight()
         self.user.set_starting_weight(weight)
+        if self.user.get_starting_weight() == previous:
+            return
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
     def update_goal_weight(self, weight: float) -> None:
         """Update the goal weight."""
+        previous = self.user.get_goal_weight()
         self.user.set_goal_weight(weight)
+        if self.user.get_goal_weight() == previous:
+            return
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
     def update_weight_unit(self, weight_unit: str) -> None:
         """Update the weight unit and refresh state."""
+        previous = self.user.get_weight_unit()
         self.user.update_weight_unit(weight_unit)
+        if self.user.get_weight_unit() == previous:
+            return
+        self._profile_attrs = None
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
     def update_goal_type(self, goal_type: str) -> None:
         """Update the goal type and refresh state."""
+        previous = self.user.get_goal_type()
         self.user.set_goal_type(goal_type)
+        if self.user.get_goal_type() == previous:
+            return
+        self._invalidate_attributes()
         self.async_write_ha_state()
 
     async def update_goal(self, goal_value: int, goal_type: str | None = None) -> None:
@@ -224,4 +305,5 @@ class CalorieTrackerSensor(RestoreSensor):
             )
 
         await self.user.add_goal(goal_type, goal_value)
+        self._invalidate_attributes()
         self.async_write_ha_state()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_right, insort
+from itertools import chain
 from typing import Any
-import uuid
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 # Compatibility for Home Assistant versions
@@ -24,6 +26,8 @@ from .const import DOMAIN, USER_PROFILE_MAP_KEY
 CALORIE_ENTRIES_PREFIX = "calorie_tracker_"
 STORAGE_VERSION = 1
 UNLINKED_EXERCISE_STORAGE_VERSION = 1
+# Seconds to wait for more changes before writing entries to disk
+SAVE_DELAY = 1.0
 
 
 class CalorieStorageManager(StorageProtocol):
@@ -37,6 +41,7 @@ class CalorieStorageManager(StorageProtocol):
             unique_id: A unique id that will persist even if the user changes their name.
 
         """
+        self._hass = hass
         self._store = Store(
             hass, STORAGE_VERSION, f"{CALORIE_ENTRIES_PREFIX}{unique_id}"
         )
@@ -45,12 +50,52 @@ class CalorieStorageManager(StorageProtocol):
         self._weights: dict[str, float] = {}
         self._body_fat_pcts: dict[str, float] = {}
         self._goals: dict[str, dict[str, Any]] = {}
+        # Goal dates in ascending order, for bisecting in get_goal
+        self._goal_dates: list[str] = []
+        # Counter behind the short hex ids of new food/exercise entries; saved
+        # with the data so ids of deleted entries aren't handed out again
+        self._next_id = 1
+        # id -> entry lookups for edits and deletes, kept alongside the lists
+        self._food_by_id: dict[str, dict[str, Any]] = {}
+        self._exercise_by_id: dict[str, dict[str, Any]] = {}
+        # "YYYY-MM" -> {"YYYY-MM-DD": food entries logged that day}
+        self._food_days: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        # Same layout for exercise entries
+        self._exercise_days: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._payload: dict[str, Any] = {}
+        self._link_payload()
+        # Single load shared by every caller, kept once it has succeeded
+        self._load_task: asyncio.Task[None] | None = None
+        # Bumped on every change to the stored data, so readers can tell
+        # whether anything they derived from it is still current
+        self._revision = 0
 
     # Note: macros are computed on-demand from food entries; no persisted
     # per-date cache is stored to avoid cache-invalidation complexity.
 
     async def async_load(self) -> None:
-        """Load stored data from disk."""
+        """Load stored data from disk.
+
+        Only the first successful call reads the file; managers are shared
+        across entry reloads and the in-memory data stays authoritative
+        afterwards.
+        """
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(
+                self._async_load_data(), eager_start=True
+            )
+        task = self._load_task
+        try:
+            # Shielded so one cancelled caller doesn't cancel the shared load
+            await asyncio.shield(task)
+        except Exception:
+            # Drop the failed load so the next caller retries it
+            if task.done() and self._load_task is task:
+                self._load_task = None
+            raise
+
+    async def _async_load_data(self) -> None:
+        """Read the stored data and rebuild the in-memory indexes."""
         data = await self._store.async_load()
         if data is not None:
             self._food_entries = data.get("food_entries", [])
@@ -58,6 +103,8 @@ class CalorieStorageManager(StorageProtocol):
             self._weights = data.get("weights", {})
             self._body_fat_pcts = data.get("body_fat_pcts", {})
             self._goals = data.get("goals", {})
+            self._goal_dates = sorted(self._goals)
+            self._link_payload()
             # Remove any zero-valued or empty-string macros from loaded
             # entries to reduce storage size and avoid numeric errors later.
             for entry in list(self._food_entries):
@@ -75,18 +122,126 @@ class CalorieStorageManager(StorageProtocol):
                         except (ValueError, TypeError):
                             # Leave non-numeric values as-is
                             continue
+            self._seed_entry_ids(data.get("next_id"))
+            self._food_by_id = {e["id"]: e for e in self._food_entries if "id" in e}
+            self._exercise_by_id = {
+                e["id"]: e for e in self._exercise_entries if "id" in e
+            }
+            self._food_days = {}
+            for entry in self._food_entries:
+                self._index_day(self._food_days, entry)
+            self._exercise_days = {}
+            for entry in self._exercise_entries:
+                self._index_day(self._exercise_days, entry)
+            self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that changes whenever the stored data changes."""
+        return self._revision
+
+    def _seed_entry_ids(self, next_id: Any) -> None:
+        """Start new entry ids at the saved counter.
+
+        Files written before the counter was saved fall back to just past the
+        highest counter id still present.
+        """
+        highest = 0
+        for entry in chain(self._food_entries, self._exercise_entries):
+            entry_id = entry.get("id")
+            # Older entries carry 32-char uuid4 hex ids, which can never collide
+            # with the shorter counter ids, so only the short ones matter here
+            if isinstance(entry_id, str) and len(entry_id) < 32:
+                try:
+                    highest = max(highest, int(entry_id, 16))
+                except ValueError:
+                    continue
+        if not isinstance(next_id, int):
+            next_id = 0
+        self._next_id = max(next_id, highest + 1)
+
+    def _new_entry_id(self) -> str:
+        """Return a new unique id for a food or exercise entry."""
+        entry_id = self._next_id
+        self._next_id += 1
+        return f"{entry_id:x}"
+
+    def _index_day(
+        self, days: dict[str, dict[str, list[dict[str, Any]]]], entry: dict[str, Any]
+    ) -> None:
+        """Add an entry to the bucket for its day."""
+        timestamp = entry.get("timestamp")
+        if not timestamp:
+            return
+        day = self._date_from_timestamp(timestamp)
+        days.setdefault(day[:7], {}).setdefault(day, []).append(entry)
+
+    def _unindex_day(
+        self, days: dict[str, dict[str, list[dict[str, Any]]]], entry: dict[str, Any]
+    ) -> None:
+        """Remove an entry from the bucket for its day."""
+        timestamp = entry.get("timestamp")
+        if not timestamp:
+            return
+        day = self._date_from_timestamp(timestamp)
+        month = days.get(day[:7])
+        bucket = month.get(day) if month else None
+        if not bucket:
+            return
+        # Match by identity; two entries can hold equal values
+        for idx, candidate in enumerate(bucket):
+            if candidate is entry:
+                del bucket[idx]
+                break
+        if not bucket:
+            del month[day]
+            if not month:
+                del days[day[:7]]
+
+    def _get_entries_and_index(
+        self, entry_type: str
+    ) -> (
+        tuple[
+            list[dict[str, Any]],
+            dict[str, dict[str, Any]],
+            dict[str, dict[str, list[dict[str, Any]]]],
+        ]
+        | None
+    ):
+        """Return the entry list, id index and day buckets for "food" or "exercise"."""
+        if entry_type == "food":
+            return self._food_entries, self._food_by_id, self._food_days
+        if entry_type == "exercise":
+            return self._exercise_entries, self._exercise_by_id, self._exercise_days
+        return None
 
     async def async_save(self) -> None:
-        """Persist the current data to disk."""
-        await self._store.async_save(
-            {
-                "food_entries": self._food_entries,
-                "exercise_entries": self._exercise_entries,
-                "weights": self._weights,
-                "body_fat_pcts": self._body_fat_pcts,
-                "goals": self._goals,
-            }
-        )
+        """Schedule the current data to be persisted to disk.
+
+        Bursts of changes are folded into a single write; Store flushes any
+        pending write when Home Assistant stops.
+        """
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _link_payload(self) -> None:
+        """Point the save payload at the current containers.
+
+        Entries are mutated in place, so this only needs to run when one of the
+        containers is replaced (load and delete).
+        """
+        self._payload = {
+            "food_entries": self._food_entries,
+            "exercise_entries": self._exercise_entries,
+            "weights": self._weights,
+            "body_fat_pcts": self._body_fat_pcts,
+            "goals": self._goals,
+        }
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self._payload["next_id"] = self._next_id
+        return self._payload
 
     async def add_goal(self, date: str, goal_type: str, goal_value: float) -> None:
         """Add a new goal entry with date, goal_type, and goal_value, and persist it.
@@ -94,7 +249,14 @@ class CalorieStorageManager(StorageProtocol):
         goal_value may be float (for percentage based variable goals) or int-like for
         fixed calorie style goals. We persist as provided without further coercion.
         """
-        self._goals[date] = {"goal_type": goal_type, "goal_value": goal_value}
+        goal = {"goal_type": goal_type, "goal_value": goal_value}
+        existing = self._goals.get(date)
+        if existing == goal:
+            return
+        if existing is None:
+            insort(self._goal_dates, date)
+        self._goals[date] = goal
+        self._revision += 1
         await self.async_save()
 
     def get_goal(self, date: str) -> dict[str, Any] | None:
@@ -108,30 +270,13 @@ class CalorieStorageManager(StorageProtocol):
             goal["start_date"] = date
             return goal
 
-        # Find the most recent goal before this date
-        goal_dates = sorted(self._goals.keys())
-        result = None
-        result_date = None
-        for goal_date in goal_dates:
-            if goal_date <= date:
-                result = self._goals[goal_date]
-                result_date = goal_date
-            else:
-                break
-
-        if result is not None:
-            goal = result.copy()
-            goal["start_date"] = result_date
-            return goal
-
-        # If no goal was set before the date, return the earliest goal
-        if goal_dates:
-            first_date = goal_dates[0]
-            goal = self._goals[first_date].copy()
-            goal["start_date"] = first_date
-            return goal
-
-        return None
+        # Find the most recent goal before this date, or fall back to the
+        # earliest goal if the date precedes all of them
+        idx = bisect_right(self._goal_dates, date)
+        result_date = self._goal_dates[idx - 1 if idx else 0]
+        goal = self._goals[result_date].copy()
+        goal["start_date"] = result_date
+        return goal
 
     def get_all_goals(self) -> dict[str, dict[str, Any]]:
         """Get all goal entries.
@@ -145,10 +290,14 @@ class CalorieStorageManager(StorageProtocol):
     def clear_goals(self) -> None:
         """Clear all goal entries."""
         self._goals.clear()
+        self._goal_dates.clear()
+        self._revision += 1
 
     async def async_clear_goals(self) -> None:
         """Clear all goal entries and persist to disk."""
         self._goals.clear()
+        self._goal_dates.clear()
+        self._revision += 1
         await self.async_save()
 
     # Food methods
@@ -172,7 +321,7 @@ class CalorieStorageManager(StorageProtocol):
         Optional macro fields (c/p/f/a) are grams and may be fractional (floats).
         """
         entry: dict[str, Any] = {
-            "id": uuid.uuid4().hex,
+            "id": self._new_entry_id(),
             "timestamp": timestamp,
             "food_item": food_item,
             "calories": calories,
@@ -204,6 +353,9 @@ class CalorieStorageManager(StorageProtocol):
                 pass
 
         self._food_entries.append(entry)
+        self._food_by_id[entry["id"]] = entry
+        self._index_day(self._food_days, entry)
+        self._revision += 1
 
     def get_food_entries(self) -> list[dict[str, Any]]:
         """Return the list of stored calorie entries.
@@ -214,6 +366,11 @@ class CalorieStorageManager(StorageProtocol):
         """
         return self._food_entries
 
+    def get_food_entries_for_date(self, date_str: str) -> list[dict[str, Any]]:
+        """Return the food entries logged on a date (YYYY-MM-DD)."""
+        day = self._date_from_timestamp(date_str)
+        return list(self._food_days.get(day[:7], {}).get(day, ()))
+
     def get_daily_macros(self, date_str: str) -> dict[str, int]:
         """Return daily totals for carbs (c), protein (p), fat (f), alcohol (a).
 
@@ -221,14 +378,8 @@ class CalorieStorageManager(StorageProtocol):
             dict with keys "c", "p", "f", "a" and integer values.
         """
         totals = {"c": 0, "p": 0, "f": 0, "a": 0}
-        # Optimize: early exit if no entries to scan
-        if not self._food_entries:
-            return totals
-
-        for entry in self._food_entries:
-            ts = entry.get("timestamp")
-            if not ts or not ts.startswith(date_str):
-                continue
+        day = self._date_from_timestamp(date_str)
+        for entry in self._food_days.get(day[:7], {}).get(day, ()):
             totals["c"] += int(entry.get("c", 0) or 0)
             totals["p"] += int(entry.get("p", 0) or 0)
             totals["f"] += int(entry.get("f", 0) or 0)
@@ -245,6 +396,11 @@ class CalorieStorageManager(StorageProtocol):
         """
         return self._exercise_entries
 
+    def get_exercise_entries_for_date(self, date_str: str) -> list[dict[str, Any]]:
+        """Return the exercise entries logged on a date (YYYY-MM-DD)."""
+        day = self._date_from_timestamp(date_str)
+        return list(self._exercise_days.get(day[:7], {}).get(day, ()))
+
     # Weight methods
     def set_weight(self, date_str: str, weight: float) -> None:
         """Set the weight for a specific date (YYYY-MM-DD).
@@ -255,6 +411,7 @@ class CalorieStorageManager(StorageProtocol):
 
         """
         self._weights[date_str] = weight
+        self._revision += 1
 
     def get_weight(self, date_str: str) -> float | None:
         """Get the weight for a specific date (YYYY-MM-DD).
@@ -286,6 +443,7 @@ class CalorieStorageManager(StorageProtocol):
 
         """
         self._body_fat_pcts[date_str] = body_fat_pct
+        self._revision += 1
 
     def get_body_fat_pct(self, date_str: str) -> float | None:
         """Get the body fat percentage for a specific date (YYYY-MM-DD).
@@ -319,18 +477,24 @@ class CalorieStorageManager(StorageProtocol):
             True if deleted, False if not found.
 
         """
-        entries = None
-        if entry_type == "food":
-            entries = self._food_entries
-        elif entry_type == "exercise":
-            entries = self._exercise_entries
-        else:
+        found = self._get_entries_and_index(entry_type)
+        if found is None:
             return False
+        entries, index, days = found
 
-        # Optimize: use list comprehension for better performance than enumerate + del
-        original_len = len(entries)
-        entries[:] = [entry for entry in entries if entry.get("id") != entry_id]
-        return len(entries) < original_len
+        entry = index.pop(entry_id, None)
+        if entry is None:
+            return False
+        # The list keeps log order for the UI, so this stays a scan rather than
+        # a swap-pop. Deletes mostly target recent entries near the end, so
+        # search backwards by identity, which also makes the del cheap.
+        for pos in range(len(entries) - 1, -1, -1):
+            if entries[pos] is entry:
+                del entries[pos]
+                break
+        self._unindex_day(days, entry)
+        self._revision += 1
+        return True
 
     async def async_delete_store(self) -> None:
         """Delete the stored calorie data file from disk."""
@@ -340,6 +504,14 @@ class CalorieStorageManager(StorageProtocol):
         self._weights = {}
         self._body_fat_pcts = {}
         self._goals = {}
+        self._goal_dates = []
+        self._link_payload()
+        self._next_id = 1
+        self._food_by_id = {}
+        self._exercise_by_id = {}
+        self._food_days = {}
+        self._exercise_days = {}
+        self._revision += 1
 
     # macros are computed on-demand; nothing to clear
 
@@ -357,51 +529,59 @@ class CalorieStorageManager(StorageProtocol):
             True if updated, False if not found.
 
         """
-        entries = None
-        if entry_type == "food":
-            entries = self._food_entries
-        elif entry_type == "exercise":
-            entries = self._exercise_entries
-        else:
+        found = self._get_entries_and_index(entry_type)
+        if found is None:
             return False
+        _, index, days = found
 
-        for idx, entry in enumerate(entries):
-            if entry["id"] == entry_id:
-                # Remove zero-valued or empty-string macro values
-                for k in ("p", "c", "f", "a"):
-                    if k in new_entry:
-                        val = new_entry.get(k)
-                        if isinstance(val, str) and val.strip() == "":
-                            new_entry.pop(k, None)
-                            continue
-                        try:
-                            if float(val) == 0.0:
-                                new_entry.pop(k, None)
-                        except (ValueError, TypeError):
-                            pass
+        entry = index.get(entry_id)
+        if entry is None:
+            return False
 
-                # Replace the entry (no persisted macro cache to maintain)
-                entries[idx] = new_entry
-                return True
-        return False
+        # Remove zero-valued or empty-string macro values
+        for k in ("p", "c", "f", "a"):
+            if k in new_entry:
+                val = new_entry.get(k)
+                if isinstance(val, str) and val.strip() == "":
+                    new_entry.pop(k, None)
+                    continue
+                try:
+                    if float(val) == 0.0:
+                        new_entry.pop(k, None)
+                except (ValueError, TypeError):
+                    pass
+
+        self._unindex_day(days, entry)
+
+        # Replace the contents in place so the entry keeps its list position
+        # (no persisted macro cache to maintain)
+        entry.clear()
+        entry.update(new_entry)
+        new_id = entry.get("id")
+        if new_id != entry_id:
+            del index[entry_id]
+            if new_id is not None:
+                index[new_id] = entry
+        self._index_day(days, entry)
+        self._revision += 1
+        return True
 
     def get_days_with_data(self, year: int, month: int) -> set[str]:
         """Return set of YYYY-MM-DD strings for days in the given month with data."""
-        days = set()
-        for entry in self._food_entries:
-            ts = entry["timestamp"]
-            # Fast string slicing: "2025-06-11T09:17:13.526445"
-            if ts.startswith(f"{year}-{month:02d}-"):
-                days.add(ts[:10])
-        return days
+        return set(self._food_days.get(f"{year}-{month:02d}", ()))
 
     async def async_log_weight(self, date_str: str, weight: float) -> None:
         """Asynchronously log a weight entry for a specific date."""
+        # Re-logging the same value leaves nothing new to write
+        if self._weights.get(date_str) == weight:
+            return
         self.set_weight(date_str, weight)
         await self.async_save()
 
     async def async_log_body_fat_pct(self, date_str: str, body_fat_pct: float) -> None:
         """Asynchronously log a body fat percentage entry for a specific date."""
+        if self._body_fat_pcts.get(date_str) == body_fat_pct:
+            return
         self.set_body_fat_pct(date_str, body_fat_pct)
         await self.async_save()
 
@@ -413,15 +593,17 @@ class CalorieStorageManager(StorageProtocol):
         calories_burned: int | None,
     ) -> None:
         """Asynchronously log an exercise entry (timestamp should be local time)."""
-        self._exercise_entries.append(
-            {
-                "id": uuid.uuid4().hex,
-                "timestamp": timestamp,
-                "exercise_type": exercise_type,
-                "duration_minutes": duration_minutes,
-                "calories_burned": calories_burned,
-            }
-        )
+        entry = {
+            "id": self._new_entry_id(),
+            "timestamp": timestamp,
+            "exercise_type": exercise_type,
+            "duration_minutes": duration_minutes,
+            "calories_burned": calories_burned,
+        }
+        self._exercise_entries.append(entry)
+        self._exercise_by_id[entry["id"]] = entry
+        self._index_day(self._exercise_days, entry)
+        self._revision += 1
         await self.async_save()
 
 
@@ -430,34 +612,52 @@ class UserProfileMapStorage:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the user profile map storage."""
+        self._hass = hass
         self._store = Store(hass, STORAGE_VERSION, USER_PROFILE_MAP_KEY)
         self._map: dict[str, str] = {}
+        # Single load shared by every caller; an empty map is a valid loaded state
+        self._load_task: asyncio.Task[None] | None = None
 
     async def async_load(self) -> None:
         """Load the user profile map from disk."""
         data = await self._store.async_load()
         self._map = data or {}
 
+    async def _async_ensure_loaded(self) -> None:
+        """Load the map once, letting concurrent first callers share the read."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(
+                self.async_load(), eager_start=True
+            )
+        task = self._load_task
+        try:
+            # Shielded so one cancelled caller doesn't cancel the shared load
+            await asyncio.shield(task)
+        except Exception:
+            # Drop the failed load so the next caller retries it
+            if task.done() and self._load_task is task:
+                self._load_task = None
+            raise
+
     async def async_save(self) -> None:
         """Persist the user profile map to disk."""
         await self._store.async_save(self._map)
 
     async def async_get(self, user_id: str) -> str | None:
         """Get the entry_id mapped to a user_id."""
-        if not self._map:
-            await self.async_load()
+        await self._async_ensure_loaded()
         return self._map.get(user_id)
 
     async def async_set(self, user_id: str, entry_id: str) -> None:
         """Set the entry_id for a user_id and persist."""
-        if not self._map:
-            await self.async_load()
+        await self._async_ensure_loaded()
         self._map[user_id] = entry_id
         await self.async_save()
 
     async def async_remove(self) -> None:
         """Remove the entire store."""
         await self._store.async_remove()
+        self._map = {}
 
 
 # Define storage key after class definition
@@ -467,6 +667,14 @@ else:
     STORAGE_KEY = f"{DOMAIN}_storage"
 
 
+def get_storage_manager(hass: HomeAssistant, unique_id: str) -> CalorieStorageManager:
+    """Return the storage manager for an entry, creating it on first use."""
+    storage_map = hass.data.setdefault(STORAGE_KEY, {})
+    if (storage := storage_map.get(unique_id)) is None:
+        storage = storage_map[unique_id] = CalorieStorageManager(hass, unique_id)
+    return storage
+
+
 def get_user_profile_map(hass: HomeAssistant) -> UserProfileMapStorage:
     """Return user profile map."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import datetime
 import json
 import logging
@@ -270,7 +271,7 @@ async def websocket_update_profile(hass: HomeAssistant, connection, msg):
                 sensor.track_macros = bool(track_macros_value)
                 await sensor.async_update_calories()
 
-            await sensor.async_update_calories()
+            await sensor.async_update_profile()
     elif username is not None:
         user_profile_map = get_user_profile_map(hass)
         await user_profile_map.async_set(username, matching_entry.entry_id)
@@ -340,7 +341,6 @@ async def websocket_update_entry(hass: HomeAssistant, connection, msg):
     user: CalorieTrackerUser = matching_entry.runtime_data["user"]
     updated = await user.update_entry(entry_type, entry_id, new_entry)
     if updated:
-        await user.storage().async_save()
         sensor = matching_entry.runtime_data.get("sensor")
         if sensor:
             await sensor.async_update_calories()
@@ -371,7 +371,6 @@ async def websocket_delete_entry(hass: HomeAssistant, connection, msg):
     user: CalorieTrackerUser = matching_entry.runtime_data["user"]
     deleted = await user.delete_entry(entry_type, entry_id)
     if deleted:
-        await user.storage().async_save()
         sensor = matching_entry.runtime_data.get("sensor")
         if sensor:
             await sensor.async_update_calories()
@@ -542,7 +541,7 @@ async def websocket_get_discovered_data(hass: HomeAssistant, connection, msg):
         msg["id"],
         {
             "discovered_data": unlinked_profiles,
-            "image_analyzers": image_analyzers,
+            "image_analyzers": [asdict(analyzer) for analyzer in image_analyzers],
         },
     )
 